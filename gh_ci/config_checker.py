@@ -1,7 +1,9 @@
 #!/usr/bin/env python3.9
 import argparse
+import asyncio
 import logging
 import os.path
+from functools import lru_cache
 
 import yaml
 import requests
@@ -24,6 +26,11 @@ from yaml_snippets.utils import (
     load_json_schema,
 )
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +38,13 @@ logging.basicConfig(
 )
 
 
+@lru_cache(maxsize=None)
+def get_json_schema(path: str) -> dict:
+    # every mirror config of the same version is checked
+    # against the same schema, so it's loaded only once
+    return load_json_schema(path=path)
+
+
 class YamlFileType(argparse.FileType):
 
     def __call__(self, string):
@@ -38,7 +52,7 @@ class YamlFileType(argparse.FileType):
         try:
             return {
                 'config_path': file_stream.name,
-                'config_data': yaml.safe_load(file_stream),
+                'config_data': yaml.load(file_stream, Loader=SafeLoader),
             }
         except yaml.YAMLError as err:
             raise argparse.ArgumentTypeError(
@@ -79,18 +93,22 @@ async def are_mirrors_available(
         main_config: MainConfig,
 ) -> int:
     ret_code = 0
-    conn = TCPConnector(limit=10000, force_close=True)
-    async with ClientSession(
-            connector=conn,
-            headers={"Connection": "close"}
-    ) as http_session:
-        for mirror in mirrors:
-            is_available = await mirror_available(
+    conn = TCPConnector(
+        limit=512,
+        limit_per_host=32,
+        ttl_dns_cache=600,
+        keepalive_timeout=60,
+    )
+    async with ClientSession(connector=conn) as http_session:
+        results = await asyncio.gather(*(
+            mirror_available(
                 mirror_info=mirror,
                 http_session=http_session,
                 logger=logger,
                 main_config=main_config,
-            )
+            ) for mirror in mirrors
+        ))
+        for is_available in results:
             # True is 1, False is 0, so
             # we get 1 if a mirror is not available
             ret_code += int(not is_available)
@@ -153,7 +171,7 @@ def main(args):
         'gh_ci/yaml_snippets/json_schemas/service_config',
         f'v{service_config_version}.json',
     )
-    json_schema = load_json_schema(path=json_schema_path)
+    json_schema = get_json_schema(path=json_schema_path)
     is_validity, err = config_validation(
         yaml_data=service_config_data,
         json_schema=json_schema,
@@ -185,7 +203,7 @@ def main(args):
             'gh_ci/yaml_snippets/json_schemas/mirror_config',
             f'v{mirror_config_version}.json',
         )
-        json_schema = load_json_schema(path=json_schema_path)
+        json_schema = get_json_schema(path=json_schema_path)
         is_validity, err = config_validation(
             yaml_data=mirror_config_data,
             json_schema=json_schema,
@@ -212,9 +230,6 @@ def main(args):
         )
         for mirror_config in args.mirror_configs
     ]
-    main_config, err_msg = process_main_config(
-        yaml_data=args.service_config['config_data'],
-    )
     exit_code += do_mirrors_have_valid_geo_data(
         mirrors=mirrors,
     )